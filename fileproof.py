@@ -1,14 +1,23 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import json
+import bisect
 import csv
+import codecs
+import concurrent.futures
+import contextlib
+import hashlib
+import itertools
+import multiprocessing
 import os
+import sys
 import threading
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, deque, OrderedDict
 from typing import Dict, List, Tuple, Optional
 import re
-import hashlib
+import mmap
+import shutil
 import webbrowser
 
 class ValidationReport:
@@ -27,26 +36,37 @@ class ValidationReport:
         self.expected_columns = 0
         self.errors = []
         self.warnings = []
+        self.error_counts = Counter()  # Type -> number of errors
+        self.error_samples = {}  # Type -> first 10 errors, for the report
+        self.warning_counts = Counter()
+        self.warning_samples = {}
         self.duplicates = []
         self.passed = False
         self.cancelled = False
+        self._report_text = None  # Cached generate_report() output, cleared when entries are added
         
     def add_error(self, row_num: int, error_type: str, description: str, row_content: str = ""):
         """Add an error to the report."""
-        self.errors.append({
+        error = {
             'row': row_num,
-            'type': error_type,
+            'type': sys.intern(error_type),
             'description': description,
             'content': row_content[:500] if row_content else ""  # Store first 500 chars
-        })
+        }
+        self.errors.append(error)
+        self._count(self.error_counts, self.error_samples, error)
+        self._report_text = None
         
     def add_warning(self, row_num: int, warning_type: str, description: str):
         """Add a warning to the report."""
-        self.warnings.append({
+        warning = {
             'row': row_num,
-            'type': warning_type,
+            'type': sys.intern(warning_type),
             'description': description
-        })
+        }
+        self.warnings.append(warning)
+        self._count(self.warning_counts, self.warning_samples, warning)
+        self._report_text = None
     
     def add_duplicate(self, row_num: int, description: str, row_content: str = ""):
         """Add a duplicate row to the report."""
@@ -56,10 +76,37 @@ class ValidationReport:
             'description': description,
             'content': row_content[:500] if row_content else ""
         })
+        self._report_text = None
         
         
+    @staticmethod
+    def _count(counts: Counter, samples: Dict[str, List[Dict]], entry: Dict):
+        """Count an entry under its type, keeping the first 10 of each type as samples."""
+        entry_type = entry['type']
+        counts[entry_type] += 1
+        bucket = samples.setdefault(entry_type, [])
+        if len(bucket) < 10:
+            bucket.append(entry)
+    
+    @staticmethod
+    def _append_grouped(report: List[str], counts: Counter, samples: Dict[str, List[Dict]], noun: str):
+        """Append entries grouped by type, most frequent first, listing the first 10 of each type."""
+        for entry_type, count in counts.most_common():
+            report.append(f"\n{entry_type} ({count} occurrences):")
+            report.append("-" * 80)
+            for entry in samples[entry_type]:
+                report.append(f"  Row {entry['row']}: {entry['description']}")
+            if count > 10:
+                report.append(f"  ... and {count - 10} more similar {noun}")
+    
     def generate_report(self) -> str:
-        """Generate a formatted text report."""
+        """Generate a formatted text report.
+        
+        Reports are generated once validation has finished, so the text is built once and reused.
+        """
+        if self._report_text is not None:
+            return self._report_text
+        
         duration = (self.end_time - self.start_time).total_seconds() if self.end_time else 0
         
         report = []
@@ -98,36 +145,14 @@ class ValidationReport:
             report.append(f"ERRORS ({len(self.errors)} found)")
             report.append("=" * 80)
             
-            # Group errors by type
-            error_groups = defaultdict(list)
-            for error in self.errors:
-                error_groups[error['type']].append(error)
-            
-            for error_type, errors in error_groups.items():
-                report.append(f"\n{error_type} ({len(errors)} occurrences):")
-                report.append("-" * 80)
-                for error in errors[:10]:  # Show first 10 of each type
-                    report.append(f"  Row {error['row']}: {error['description']}")
-                if len(errors) > 10:
-                    report.append(f"  ... and {len(errors) - 10} more similar errors")
+            self._append_grouped(report, self.error_counts, self.error_samples, "errors")
         
         if self.warnings:
             report.append(f"\n" + "=" * 80)
             report.append(f"WARNINGS ({len(self.warnings)} found)")
             report.append("=" * 80)
             
-            # Group warnings by type
-            warning_groups = defaultdict(list)
-            for warning in self.warnings:
-                warning_groups[warning['type']].append(warning)
-            
-            for warning_type, warnings in warning_groups.items():
-                report.append(f"\n{warning_type} ({len(warnings)} occurrences):")
-                report.append("-" * 80)
-                for warning in warnings[:10]:
-                    report.append(f"  Row {warning['row']}: {warning['description']}")
-                if len(warnings) > 10:
-                    report.append(f"  ... and {len(warnings) - 10} more similar warnings")
+            self._append_grouped(report, self.warning_counts, self.warning_samples, "warnings")
         
         if self.duplicates:
             report.append(f"\n" + "=" * 80)
@@ -151,34 +176,162 @@ class ValidationReport:
         report.append("END OF REPORT")
         report.append("=" * 80)
         
-        return "\n".join(report)
+        self._report_text = "\n".join(report)
+        return self._report_text
     
     def export_errors_csv(self, output_path: str):
         """Export errors to a CSV file for easy analysis."""
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=1024 * 1024) as f:
             writer = csv.writer(f)
             writer.writerow(['Row Number', 'Error Type', 'Description', 'Row Content Preview'])
-            for error in self.errors:
-                content_preview = error.get('content', '')[:200]  # First 200 chars
-                writer.writerow([
-                    error['row'], 
-                    error['type'], 
-                    error['description'], 
-                    content_preview
-                ])
+            writer.writerows(
+                (error['row'], error['type'], error['description'], error.get('content', '')[:200])  # First 200 chars
+                for error in self.errors
+            )
+
+class BloomFilter:
+    """Set of 64-bit hashes that may report false positives, never false negatives.
+    
+    Memory grows with the number of items: a new, larger layer is added each time the
+    last one fills up, so a low capacity estimate costs memory rather than accuracy.
+    """
+    
+    BITS_PER_ITEM = 10  # First layer: with 3 probes this gives roughly a 1.7% false positive rate
+    PROBES = 3
+    # Each later layer gets 2 more bits per item and one more probe, which cuts its false
+    # positive rate to about a third of the previous one. The rates of all layers add up,
+    # so the total stays under about 3% however many layers are added.
+    LAYER_EXTRA_BITS = 2
+    
+    def __init__(self, capacity: int):
+        self.capacity = max(capacity, 1024)
+        self.layers = []  # (bit array, bit count, probe count) for each layer
+        self.count = 0
+        self.limit = 0
+        self._add_layer()
+    
+    def _add_layer(self):
+        layer = len(self.layers)
+        capacity = self.capacity * 2 ** layer
+        size = capacity * (self.BITS_PER_ITEM + self.LAYER_EXTRA_BITS * layer)
+        self.layers.append((bytearray((size + 7) // 8), size, self.PROBES + layer))
+        self.limit = self.count + capacity
+    
+    @staticmethod
+    def _positions(item_hash: int, size: int, probes: int) -> Tuple[int, ...]:
+        """Bit positions for a hash, by double hashing so every probe spans the whole array."""
+        item_hash &= 0xFFFFFFFFFFFFFFFF
+        step = (item_hash >> 32) | 1
+        if probes == 3:
+            # The first layer holds most items when the capacity estimate is right; spell it out
+            return item_hash % size, (item_hash + step) % size, (item_hash + 2 * step) % size
+        return tuple([(item_hash + probe * step) % size for probe in range(probes)])
+    
+    def __contains__(self, item_hash: int) -> bool:
+        for bits, size, probes in self.layers:
+            for position in self._positions(item_hash, size, probes):
+                if not bits[position >> 3] & (1 << (position & 7)):
+                    break
+            else:
+                return True
+        return False
+    
+    def add(self, item_hash: int):
+        if self.count >= self.limit:
+            self._add_layer()
+        bits, size, probes = self.layers[-1]
+        for position in self._positions(item_hash, size, probes):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+def _iter_line_batches(data, start: int = 0, end: Optional[int] = None, batch_size: int = 1024 * 1024):
+    """Yield (offset, lines) for the lines of data[start:end], about batch_size bytes at a time.
+    
+    Lines end at CRLF, CR or LF as in text mode and keep their line endings; offset is
+    where the batch ends. data can be bytes or a memory map.
+    """
+    end = len(data) if end is None else end
+    pending = []  # Start of a line that runs past the current chunk
+    position = start
+    while position < end:
+        chunk = data[position:min(position + batch_size, end)]
+        position += len(chunk)
+        if position < end:
+            # Hold back the unfinished last line, and a final CR that may pair with an LF in the next chunk
+            search_end = len(chunk) - 1 if chunk.endswith(b'\r') else len(chunk)
+            cut = max(chunk.rfind(b'\n', 0, search_end), chunk.rfind(b'\r', 0, search_end)) + 1
+            if not cut:
+                pending.append(chunk)
+                continue
+            pending.append(chunk[:cut])
+            lines = b''.join(pending).splitlines(True)
+            pending = [chunk[cut:]]
+        else:
+            pending.append(chunk)
+            lines = b''.join(pending).splitlines(True)
+        yield position, lines
+
+def _run_in_processes(function, task_args: List[tuple], workers: int, cancel_event=None,
+                      result_callback=None) -> bool:
+    """Run function(*args, worker_cancel) for each args of task_args in worker processes.
+    
+    result_callback(index, result) is called in the calling thread as each task finishes.
+    Returns False if cancel_event was set first; worker_cancel is then set so running
+    tasks can stop early, and tasks that have not started are dropped.
+    """
+    # A threading.Event cannot reach other processes, so the workers watch a manager's event
+    with multiprocessing.Manager() as manager:
+        worker_cancel = manager.Event()
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = {executor.submit(function, *args, worker_cancel): index
+                       for index, args in enumerate(task_args)}
+            pending = set(futures)
+            while pending:
+                done, pending = concurrent.futures.wait(
+                    pending, timeout=0.1, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    if result_callback:
+                        result_callback(futures[future], result)
+                
+                if cancel_event and cancel_event.is_set():
+                    return False
+            return True
+        finally:
+            # Running tasks check the event as they go, so waiting for them is quick
+            worker_cancel.set()
+            if sys.version_info >= (3, 9):
+                executor.shutdown(cancel_futures=True)
+            else:
+                executor.shutdown()  # Tasks that had not started see the event and return at once
 
 class DelimitedFileValidator:
     """Validates delimited files (CSV, TSV, pipe-delimited, etc.)"""
     
     COMMON_DELIMITERS = [',', '|', '\t', '*', ';', ':']
-    
+    DETECTION_EARLY_EXIT_LINES = 5  # Non-empty sample lines that must agree before detection stops early
+    EXACT_DUPLICATE_ROWS = 4_000_000  # Above this estimated row count, seen rows go in a Bloom filter
+    PARALLEL_MIN_SIZE = 64 * 1024 * 1024  # Files at least this large are checked in worker processes
+    PARALLEL_CHUNK_SIZE = 16 * 1024 * 1024  # Bytes of rows handed to a worker per task
+
+    # A quoted section opens on a quote not preceded by a backslash and runs to the
+    # next unescaped quote of the same kind (or to the end of the line if unclosed)
+    _QUOTED_SECTION = re.compile(r'''(?<!\\)(?:"(?:[^"]|(?<=\\)")*(?:"|\Z)|'(?:[^']|(?<=\\)')*(?:'|\Z))''')
+    _QUOTED_SECTION_BYTES = re.compile(_QUOTED_SECTION.pattern.encode('ascii'))
+    _LINE_BREAK = re.compile(rb'\r\n?|\n')
+    # Row edge bytes that may be whitespace to str.strip but not to bytes.strip
+    _TEXT_WHITESPACE_EDGE = frozenset(range(0x1c, 0x20)) | frozenset(range(0x80, 0x100))
+
     def __init__(self, filepath: str, delimiter: Optional[str] = None, 
-                 max_errors: int = 1000, chunk_size: int = 8192, check_duplicates: bool = False, cancel_event: Optional[threading.Event] = None):
+                 max_errors: int = 1000, chunk_size: int = 1024 * 1024, check_duplicates: bool = False, cancel_event: Optional[threading.Event] = None,
+                 max_workers: Optional[int] = None):
         self.filepath = filepath
         self.delimiter = delimiter
         self.max_errors = max_errors
         self.chunk_size = chunk_size
         self.check_duplicates = check_duplicates
+        self.max_workers = max_workers  # Process limit for large files; defaults to the CPU count
         self.report = ValidationReport(os.path.basename(filepath))
         self.cancel_event = cancel_event
         
@@ -188,16 +341,28 @@ class DelimitedFileValidator:
             return self.delimiter
             
         delimiter_counts = {delim: [] for delim in self.COMMON_DELIMITERS}
+        lines_seen = 0
         
         for line in sample_lines[:20]:  # Use first 20 lines
             line = line.strip()
             if not line:
                 continue
-                
+
+            # Strip quoted sections once, then count every candidate outside of quotes
+            if '"' in line or "'" in line:
+                line = self._QUOTED_SECTION.sub('', line)
             for delim in self.COMMON_DELIMITERS:
-                # Count delimiters outside of quotes
-                count = self._count_delimiter_outside_quotes(line, delim)
-                delimiter_counts[delim].append(count)
+                delimiter_counts[delim].append(line.count(delim))
+            lines_seen += 1
+            
+            # Stop early once the first lines agree on a delimiter. Later lines could still break
+            # that agreement, so this can pick a different delimiter than scoring the full sample;
+            # that trade-off is deliberate to keep detection fast
+            if lines_seen == self.DETECTION_EARLY_EXIT_LINES:
+                consistent = [delim for delim, counts in delimiter_counts.items()
+                              if counts[0] > 0 and counts.count(counts[0]) == lines_seen]
+                if consistent:
+                    return max(consistent, key=lambda delim: delimiter_counts[delim][0])
         
         # Find delimiter with most consistent count (and count > 0)
         best_delimiter = None
@@ -233,58 +398,208 @@ class DelimitedFileValidator:
     
     def _count_delimiter_outside_quotes(self, line: str, delimiter: str) -> int:
         """Count delimiters that are outside quoted sections."""
-        count = 0
-        in_quotes = False
-        quote_char = None
-        
-        for i, char in enumerate(line):
-            if char in ('"', "'") and (i == 0 or line[i-1] != '\\'):
-                if not in_quotes:
-                    in_quotes = True
-                    quote_char = char
-                elif char == quote_char:
-                    in_quotes = False
-                    quote_char = None
-            elif char == delimiter and not in_quotes:
-                count += 1
-        
-        return count
-    
-    def _parse_line_with_quotes(self, line: str, delimiter: str) -> List[str]:
-        """Parse a line respecting quoted sections."""
-        fields = []
-        current_field = []
-        in_quotes = False
-        quote_char = None
-        
-        i = 0
-        while i < len(line):
-            char = line[i]
-            
-            if char in ('"', "'") and (i == 0 or line[i-1] != '\\'):
-                if not in_quotes:
-                    in_quotes = True
-                    quote_char = char
-                elif char == quote_char:
-                    # Check for escaped quote (double quote)
-                    if i + 1 < len(line) and line[i + 1] == quote_char:
-                        current_field.append(char)
-                        i += 1
+        if '"' not in line and "'" not in line:
+            return line.count(delimiter)
+
+        # Drop the quoted sections in one regex pass, then count what is left
+        return self._QUOTED_SECTION.sub('', line).count(delimiter)
+    
+    def _estimate_rows(self, sample_lines: List[str]) -> int:
+        """Estimate the file's row count from the average length of the sampled lines."""
+        sample_bytes = sum(len(line.encode('utf-8')) for line in sample_lines)
+        if not sample_bytes:
+            return 0
+        return self.report.file_size * len(sample_lines) // sample_bytes
+    
+    def _strip_row(self, line: bytes) -> bytes:
+        """Strip a row's surrounding whitespace the way str.strip does on the decoded text."""
+        line = line.strip()
+        # bytes.strip only removes ASCII whitespace, so rows that start or end in a byte
+        # str.strip might also remove (NBSP, U+2028, \x1c-\x1f...) are stripped as text
+        if line and (line[0] in self._TEXT_WHITESPACE_EDGE or line[-1] in self._TEXT_WHITESPACE_EDGE):
+            text = line.decode('utf-8', errors='replace')
+            stripped = text.strip()
+            if len(stripped) != len(text):
+                line = stripped.encode('utf-8')
+        return line
+    
+    def _scan_line(self, line: bytes, delimiter: bytes) -> Tuple[int, int, int]:
+        """Count delimiters outside quotes and the parity of unescaped double and single quotes."""
+        if b'"' not in line and b"'" not in line:
+            return line.count(delimiter), 0, 0
+        
+        count = self._QUOTED_SECTION_BYTES.sub(b'', line).count(delimiter)
+        odd_double = (line.count(b'"') - line.count(b'\\"')) % 2
+        odd_single = (line.count(b"'") - line.count(b"\\'")) % 2
+        return count, odd_double, odd_single
+    
+    def _scan_rows(self, data, delimiter: bytes, expected_columns: int, progress_callback=None,
+                   seen_hashes=None, repeated_hashes=None, start: int = 0, end: Optional[int] = None,
+                   row_hash=hash) -> Tuple[int, List[tuple], List[tuple]]:
+        """Check each line of data[start:end], adding to the report's row totals.
+        
+        Returns the number of lines checked (blank ones included) and the first max_errors
+        errors and warnings as add_error/add_warning argument tuples. Row hashes from
+        row_hash are collected for duplicate detection when seen_hashes is given.
+        """
+        row_num = 0
+        mismatch_descriptions = {}  # actual column count -> shared description string
+        errors = []
+        warnings = []
+        
+        # Hoist lookups out of the row loop
+        report = self.report
+        file_size = report.file_size
+        max_errors = self.max_errors
+        cancel_event = self.cancel_event
+        check_duplicates = seen_hashes is not None
+        scan_line = self._scan_line
+        strip_row = self._strip_row
+        text_whitespace_edge = self._TEXT_WHITESPACE_EDGE
+        error_count = 0
+        warning_count = 0
+        
+        for offset, lines in _iter_line_batches(data, start, end):
+            for line in lines:
+                # Check for cancellation every 1000 rows; an event shared with worker processes is slow to query
+                if row_num % 1000 == 0 and cancel_event and cancel_event.is_set():
+                    report.cancelled = True
+                    break
+                
+                row_num += 1
+                
+                if progress_callback and row_num % 1000 == 0:
+                    progress = (offset / file_size) * 100
+                    progress_callback(progress, row_num, error_count)
+                
+                line = line.strip()
+                if line and (line[0] in text_whitespace_edge or line[-1] in text_whitespace_edge):
+                    line = strip_row(line)
+                if not line:
+                    continue
+                
+                report.total_rows += 1
+                
+                # Collect row hash for duplicate detection; candidates are confirmed afterwards
+                if check_duplicates:
+                    line_hash = row_hash(line)
+                    if line_hash in seen_hashes:
+                        repeated_hashes.add(line_hash)
                     else:
-                        in_quotes = False
-                        quote_char = None
+                        seen_hashes.add(line_hash)
+                
+                # Count delimiters and quote parity in one scan
+                delimiter_count, odd_double_quotes, odd_single_quotes = scan_line(line, delimiter)
+                actual_columns = delimiter_count + 1
+                
+                if actual_columns != expected_columns:
+                    report.invalid_rows += 1
+                    if error_count < max_errors:
+                        error_count += 1
+                        description = mismatch_descriptions.get(actual_columns)
+                        if description is None:
+                            description = f"Expected {expected_columns} columns, found {actual_columns}"
+                            mismatch_descriptions[actual_columns] = description
+                        errors.append((
+                            row_num,
+                            "COLUMN_COUNT_MISMATCH",
+                            description,
+                            line.decode('utf-8', errors='replace')
+                        ))
+                elif odd_double_quotes:
+                    report.invalid_rows += 1
+                    if error_count < max_errors:
+                        error_count += 1
+                        errors.append((
+                            row_num,
+                            "UNCLOSED_QUOTES",
+                            "Unclosed double quotes detected",
+                            line.decode('utf-8', errors='replace')
+                        ))
+                elif odd_single_quotes:
+                    if warning_count < max_errors:
+                        warning_count += 1
+                        warnings.append((
+                            row_num,
+                            "UNCLOSED_QUOTES",
+                            "Unclosed single quotes detected"
+                        ))
                 else:
-                    current_field.append(char)
-            elif char == delimiter and not in_quotes:
-                fields.append(''.join(current_field))
-                current_field = []
-            else:
-                current_field.append(char)
+                    report.valid_rows += 1
             
-            i += 1
+            if report.cancelled:
+                break
         
-        fields.append(''.join(current_field))
-        return fields
+        return row_num, errors, warnings
+    
+    def _scan_parallel(self, mm: mmap.mmap, workers: int, expected_columns: int, progress_callback=None,
+                       seen_hashes=None, repeated_hashes=None) -> Tuple[int, List[tuple], List[tuple]]:
+        """Check the mapped file's rows in worker processes, one line-aligned byte range per task.
+        
+        Returns the same (lines, errors, warnings) as _scan_rows, with file-wide row numbers.
+        When seen_hashes is given, each range's row hashes (from _stable_row_hash) are merged
+        into it and repeated_hashes. On cancellation only the leading ranges that finished are counted.
+        """
+        report = self.report
+        check_duplicates = seen_hashes is not None
+        
+        # Split into ranges that end just after a line break
+        ranges = []
+        start = 0
+        while start < report.file_size:
+            line_break = self._LINE_BREAK.search(mm, min(start + self.PARALLEL_CHUNK_SIZE, report.file_size) - 1)
+            end = line_break.end() if line_break else report.file_size
+            ranges.append((start, end))
+            start = end
+        
+        results = [None] * len(ranges)
+        done_bytes = 0
+        
+        def collect(index, range_result):
+            nonlocal done_bytes
+            *result, range_seen, range_repeated = range_result
+            results[index] = result
+            done_bytes += ranges[index][1] - ranges[index][0]
+            
+            # A row repeats if it repeats within a range or was already seen in another one
+            if check_duplicates:
+                repeated_hashes.update(range_repeated)
+                if isinstance(seen_hashes, set):
+                    repeated_hashes.update(seen_hashes & range_seen)
+                    seen_hashes.update(range_seen)
+                else:
+                    for row_hash in range_seen:
+                        if row_hash in seen_hashes:
+                            repeated_hashes.add(row_hash)
+                        else:
+                            seen_hashes.add(row_hash)
+            
+            if progress_callback:
+                scanned = sum(result[0] for result in results if result)
+                error_total = sum(len(result[4]) for result in results if result)
+                progress_callback((done_bytes / report.file_size) * 100, scanned, error_total)
+        
+        task_args = [(self.filepath, start, end, self.delimiter, expected_columns, self.max_errors,
+                      check_duplicates) for start, end in ranges]
+        if not _run_in_processes(_scan_file_range, task_args, workers, self.cancel_event, collect):
+            report.cancelled = True
+        
+        # Merge the leading finished ranges in file order, shifting row numbers and re-applying the caps
+        row_offset = 0
+        errors = []
+        warnings = []
+        for result in results:
+            if result is None:
+                break
+            lines, total_rows, valid_rows, invalid_rows, range_errors, range_warnings = result
+            report.total_rows += total_rows
+            report.valid_rows += valid_rows
+            report.invalid_rows += invalid_rows
+            errors.extend((row + row_offset, *rest) for row, *rest in range_errors)
+            warnings.extend((row + row_offset, *rest) for row, *rest in range_warnings)
+            row_offset += lines
+        
+        return row_offset, errors[:self.max_errors], warnings[:self.max_errors]
     
     def validate(self, progress_callback=None) -> ValidationReport:
         """Validate the delimited file."""
@@ -292,112 +607,89 @@ class DelimitedFileValidator:
         self.report.file_size = os.path.getsize(self.filepath)
         
         try:
-            with open(self.filepath, 'r', encoding='utf-8', errors='replace') as f:
-                # Read sample for delimiter detection
-                sample_lines = []
-                for _ in range(50):
-                    line = f.readline()
-                    if not line:
-                        break
-                    sample_lines.append(line)
+            if self.report.file_size == 0:
+                self.report.add_error(0, "EMPTY_FILE", "File is empty")
+                self.report.end_time = datetime.now()
+                return self.report
+            
+            # Map the file and work on raw bytes; rows are only decoded when reported
+            with open(self.filepath, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Rows are read front to back, so let the OS read ahead aggressively
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
                 
-                if not sample_lines:
-                    self.report.add_error(0, "EMPTY_FILE", "File is empty")
-                    self.report.end_time = datetime.now()
-                    return self.report
+                # Read sample for delimiter detection
+                lines = (line for _, batch in _iter_line_batches(mm) for line in batch)
+                sample_lines = [line.decode('utf-8', errors='replace') for line in itertools.islice(lines, 50)]
                 
                 # Detect delimiter
                 self.delimiter = self.detect_delimiter(sample_lines)
                 self.report.delimiter = repr(self.delimiter).strip("'")
+                delimiter = self.delimiter.encode('utf-8')
                 
                 # Determine expected columns from header
                 header_line = sample_lines[0].strip()
                 expected_columns = self._count_delimiter_outside_quotes(header_line, self.delimiter) + 1
                 self.report.expected_columns = expected_columns
                 
-                # Reset file pointer
-                f.seek(0)
-                
-                row_num = 0
-                bytes_processed = 0
-                row_hashes = {}  # For duplicate detection: hash -> list of (row_num, line)
+                report = self.report
                 
-                for line in f:
-                    row_num += 1
-                    bytes_processed += len(line.encode('utf-8'))
-                    
-                    # Check for cancellation
-                    if self.cancel_event and self.cancel_event.is_set():
-                        self.report.cancelled = True
-                        break
-                    
-                    if progress_callback and row_num % 1000 == 0:
-                        progress = (bytes_processed / self.report.file_size) * 100
-                        progress_callback(progress, row_num, len(self.report.errors))
-                    
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    self.report.total_rows += 1
-                    
-                    # Collect row hash for duplicate detection
-                    if self.check_duplicates:
-                        row_hash = hashlib.md5(line.encode('utf-8')).hexdigest()
-                        if row_hash not in row_hashes:
-                            row_hashes[row_hash] = []
-                        row_hashes[row_hash].append((row_num, line))
-                    
-                    # Count delimiters
-                    delimiter_count = self._count_delimiter_outside_quotes(line, self.delimiter)
-                    actual_columns = delimiter_count + 1
-                    
-                    if actual_columns != expected_columns:
-                        self.report.invalid_rows += 1
-                        if len(self.report.errors) < self.max_errors:
-                            self.report.add_error(
-                                row_num,
-                                "COLUMN_COUNT_MISMATCH",
-                                f"Expected {expected_columns} columns, found {actual_columns}",
-                                line
-                            )
+                # Duplicate detection: hashes of rows seen so far, and hashes seen more than once.
+                # Huge files track seen rows in a Bloom filter, which takes a few bytes per row.
+                seen_hashes = repeated_hashes = None
+                if self.check_duplicates:
+                    estimated_rows = self._estimate_rows(sample_lines)
+                    if estimated_rows > self.EXACT_DUPLICATE_ROWS:
+                        seen_hashes = BloomFilter(estimated_rows)
                     else:
-                        # Parse the line to check for unescaped delimiters in data
-                        fields = self._parse_line_with_quotes(line, self.delimiter)
-                        
-                        # Check for unclosed quotes
-                        quote_count_double = line.count('"') - line.count('\\"')
-                        quote_count_single = line.count("'") - line.count("\\'")
-                        
-                        if quote_count_double % 2 != 0:
-                            self.report.invalid_rows += 1
-                            if len(self.report.errors) < self.max_errors:
-                                self.report.add_error(
-                                    row_num,
-                                    "UNCLOSED_QUOTES",
-                                    "Unclosed double quotes detected",
-                                    line
-                                )
-                        elif quote_count_single % 2 != 0:
-                            if len(self.report.warnings) < self.max_errors:
-                                self.report.add_warning(
-                                    row_num,
-                                    "UNCLOSED_QUOTES",
-                                    "Unclosed single quotes detected"
-                                )
-                        else:
-                            self.report.valid_rows += 1
+                        seen_hashes = set()
+                    repeated_hashes = set()
+                
+                # Large files are split across processes
+                workers = min(self.max_workers or os.cpu_count() or 1, report.file_size // self.PARALLEL_CHUNK_SIZE)
+                if report.file_size < self.PARALLEL_MIN_SIZE or workers < 2:
+                    row_hash = hash
+                    rows_read, errors, warnings = self._scan_rows(
+                        mm, delimiter, expected_columns, progress_callback, seen_hashes, repeated_hashes)
+                else:
+                    # hash() is salted per process, so rows hashed in workers use a fixed digest
+                    row_hash = _stable_row_hash
+                    rows_read, errors, warnings = self._scan_parallel(
+                        mm, workers, expected_columns, progress_callback, seen_hashes, repeated_hashes)
+                
+                for error in errors:
+                    report.add_error(*error)
+                for warning in warnings:
+                    report.add_warning(*warning)
                 
-
-
                 # Check for duplicates
-                if self.check_duplicates:
-                    for row_hash, occurrences in row_hashes.items():
+                if self.check_duplicates and repeated_hashes:
+                    # Second pass over the scanned rows: group candidates by their exact bytes
+                    seen_hashes = None  # Release the first-pass filter before grouping
+                    last_row = rows_read
+                    duplicate_groups = {}  # Line -> row numbers, in order of first occurrence
+                    lines = (line for _, batch in _iter_line_batches(mm) for line in batch)
+                    for rnum, line in enumerate(itertools.islice(lines, last_row), start=1):
+                        line = self._strip_row(line)
+                        if line and row_hash(line) in repeated_hashes:
+                            duplicate_groups.setdefault(line, []).append(rnum)
+                    
+                    for line, occurrences in duplicate_groups.items():
                         if len(occurrences) > 1:
-                            # All rows with this hash are duplicates
-                            duplicate_rows = [str(rnum) for rnum, _ in occurrences]
-                            for rnum, line_content in occurrences:
-                                other_rows = ', '.join([r for r in duplicate_rows if r != str(rnum)])
+                            # All rows in this group are duplicates
+                            line_content = line.decode('utf-8', errors='replace')
+                            duplicate_rows = [str(rnum) for rnum in occurrences]
+                            all_rows = ', '.join(duplicate_rows)
+                            start = 0
+                            for rnum, row in zip(occurrences, duplicate_rows):
+                                # Cut this row and one separator out of the shared list
+                                end = start + len(row)
+                                if start:
+                                    other_rows = all_rows[:start - 2] + all_rows[end:]
+                                else:
+                                    other_rows = all_rows[end + 2:]
+                                start = end + 2
                                 self.report.add_duplicate(
                                     rnum,
                                     f"Exact duplicate of row(s): {other_rows}",
@@ -421,14 +713,202 @@ class DelimitedFileValidator:
         
         return self.report
 
+def _stable_row_hash(line: bytes) -> int:
+    """Hash a row the same way in every process, unlike hash(), which is salted per process."""
+    return int.from_bytes(hashlib.blake2b(line, digest_size=8).digest(), 'little')
+
+def _scan_file_range(filepath: str, start: int, end: int, delimiter: str, expected_columns: int,
+                     max_errors: int, check_duplicates: bool, cancel_event=None) -> tuple:
+    """Worker process entry point: check the rows in one byte range of a delimited file."""
+    validator = DelimitedFileValidator(filepath, delimiter=delimiter, max_errors=max_errors,
+                                       cancel_event=cancel_event)
+    seen_hashes = repeated_hashes = None
+    if check_duplicates:
+        seen_hashes = set()
+        repeated_hashes = set()
+    with open(filepath, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        lines, errors, warnings = validator._scan_rows(mm, delimiter.encode('utf-8'), expected_columns,
+                                                       seen_hashes=seen_hashes, repeated_hashes=repeated_hashes,
+                                                       start=start, end=end, row_hash=_stable_row_hash)
+    report = validator.report
+    return (lines, report.total_rows, report.valid_rows, report.invalid_rows, errors, warnings,
+            seen_hashes, repeated_hashes)
+
 class JSONValidator:
     """Validates JSON files."""
     
-    def __init__(self, filepath: str, max_errors: int = 1000, cancel_event: Optional[threading.Event] = None):
+    # Same whitespace set the json module skips between tokens
+    _WHITESPACE = re.compile(r'[ \t\n\r]*')
+    # A value ending this close to the end of the buffer may continue in the next chunk
+    _LOOKAHEAD = 16
+    
+    def __init__(self, filepath: str, max_errors: int = 1000, chunk_size: int = 1024 * 1024,
+                 cancel_event: Optional[threading.Event] = None):
         self.filepath = filepath
         self.max_errors = max_errors
+        self.chunk_size = chunk_size
         self.report = ValidationReport(os.path.basename(filepath))
         self.cancel_event = cancel_event
+    
+    def _is_array(self, head: bytes) -> bool:
+        """Check whether the file starts with a UTF-8 encoded top-level array."""
+        if b'\x00' in head[:4]:  # UTF-16/32 is left to json.loads to detect
+            return False
+        if head.startswith(codecs.BOM_UTF8):
+            head = head[len(codecs.BOM_UTF8):]
+        return head.lstrip(b' \t\n\r').startswith(b'[')
+    
+    def _iter_array(self, f, head: bytes):
+        """Yield the items of a top-level JSON array, reading the file chunk by chunk.
+        
+        Only the current item and the unread part of the last chunk are held in memory.
+        Raises json.JSONDecodeError with positions relative to the whole file.
+        """
+        decoder = codecs.getincrementaldecoder('utf-8-sig')()
+        scanner = json.JSONDecoder()
+        whitespace = self._WHITESPACE.match
+        lookahead = self._LOOKAHEAD
+        
+        buf = decoder.decode(head)
+        pos = whitespace(buf).end() + 1  # Skip the opening bracket
+        eof = False
+        read_size = self.chunk_size
+        # Position of buf[0] within the file, for error messages
+        chars_dropped = 0
+        lines_dropped = 0
+        column_offset = 0
+        
+        def fill():
+            nonlocal buf, pos, eof, chars_dropped, lines_dropped, column_offset
+            data = f.read(read_size)
+            eof = not data
+            dropped = buf[:pos]
+            newlines = dropped.count('\n')
+            if newlines:
+                lines_dropped += newlines
+                column_offset = len(dropped) - dropped.rfind('\n') - 1
+            else:
+                column_offset += len(dropped)
+            chars_dropped += len(dropped)
+            buf = buf[pos:] + decoder.decode(data, final=eof)
+            pos = 0
+        
+        def error_at(msg, at):
+            newlines = buf.count('\n', 0, at)
+            lineno = lines_dropped + newlines + 1
+            colno = at - buf.rfind('\n', 0, at) if newlines else column_offset + at + 1
+            error = json.JSONDecodeError(msg, '', 0)
+            error.args = (f"{msg}: line {lineno} column {colno} (char {chars_dropped + at})",)
+            error.lineno, error.colno, error.pos = lineno, colno, chars_dropped + at
+            return error
+        
+        expecting_value = True
+        first = True
+        while True:
+            pos = whitespace(buf, pos).end()
+            if pos == len(buf):
+                if eof:
+                    raise error_at("Expecting value" if expecting_value else "Expecting ',' delimiter", pos)
+                fill()
+                continue
+            
+            if not expecting_value:
+                if buf[pos] == ',':
+                    pos += 1
+                    expecting_value = True
+                elif buf[pos] == ']':
+                    pos += 1
+                    break
+                else:
+                    raise error_at("Expecting ',' delimiter", pos)
+                continue
+            
+            if first and buf[pos] == ']':
+                pos += 1
+                break
+            
+            try:
+                item, end = scanner.raw_decode(buf, pos)
+            except json.JSONDecodeError as e:
+                # Errors at the end of the buffer (or in an open string) may just be a cut-off value
+                if not eof and (e.pos >= len(buf) - lookahead or e.msg.startswith('Unterminated string')):
+                    fill()
+                    read_size *= 2
+                    continue
+                raise error_at(e.msg, e.pos)
+            if not eof and end >= len(buf) - lookahead:
+                fill()
+                read_size *= 2
+                continue
+            
+            pos = end
+            read_size = self.chunk_size
+            expecting_value = False
+            first = False
+            yield item
+        
+        # Only whitespace may follow the closing bracket
+        while True:
+            pos = whitespace(buf, pos).end()
+            if pos < len(buf):
+                raise error_at("Extra data", pos)
+            if eof:
+                return
+            fill()
+    
+    def _check_items(self, items, progress_callback=None, f=None):
+        """Check that every item of a top-level array has the keys of the first one."""
+        report = self.report
+        expected_keys = None
+        
+        for idx, item in enumerate(items, start=1):
+            if idx % 1000 == 0:
+                # Check for cancellation every 1000 items; an event shared with worker processes is slow to query
+                if self.cancel_event and self.cancel_event.is_set():
+                    report.cancelled = True
+                    break
+            
+            report.total_rows += 1
+            report.valid_rows += 1
+            
+            if progress_callback and f is not None and idx % 1000 == 0:
+                progress = (f.tell() / report.file_size) * 100
+                progress_callback(progress, idx, len(report.errors))
+            
+            if idx == 1:
+                # Check for consistent structure
+                if isinstance(item, dict):
+                    expected_keys = set(item.keys())
+                    report.expected_columns = len(expected_keys)
+                continue
+            
+            if expected_keys is None:
+                continue
+            
+            if not isinstance(item, dict):
+                report.invalid_rows += 1
+                report.valid_rows -= 1
+                if len(report.errors) < self.max_errors:
+                    report.add_error(
+                        idx,
+                        "TYPE_MISMATCH",
+                        f"Expected dict, got {type(item).__name__}"
+                    )
+            elif set(item.keys()) != expected_keys:
+                if len(report.warnings) < self.max_errors:
+                    missing = expected_keys - set(item.keys())
+                    extra = set(item.keys()) - expected_keys
+                    msg = []
+                    if missing:
+                        msg.append(f"Missing keys: {missing}")
+                    if extra:
+                        msg.append(f"Extra keys: {extra}")
+                    report.add_warning(
+                        idx,
+                        "KEY_MISMATCH",
+                        "; ".join(msg)
+                    )
         
     def validate(self, progress_callback=None) -> ValidationReport:
         """Validate the JSON file."""
@@ -437,63 +917,38 @@ class JSONValidator:
         self.report.file_type = "JSON"
         
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-                if progress_callback:
-                    progress_callback(50, 0, len(self.report.errors))
+            with open(self.filepath, 'rb') as f:
+                # The file is read front to back, so let the OS read ahead aggressively
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                head = f.read(self.chunk_size)
                 
                 try:
-                    data = json.loads(content)
-                    
-                    # Analyze structure
-                    if isinstance(data, list):
-                        self.report.total_rows = len(data)
-                        self.report.valid_rows = len(data)
-                        
-                        # Check for consistent structure
-                        if data and isinstance(data[0], dict):
-                            expected_keys = set(data[0].keys())
-                            self.report.expected_columns = len(expected_keys)
-                            
-                            for idx, item in enumerate(data[1:], start=2):
-                                # Check for cancellation
-                                if self.cancel_event and self.cancel_event.is_set():
-                                    self.report.cancelled = True
-                                    break
-                                    
-                                if not isinstance(item, dict):
-                                    self.report.invalid_rows += 1
-                                    self.report.valid_rows -= 1
-                                    if len(self.report.errors) < self.max_errors:
-                                        self.report.add_error(
-                                            idx,
-                                            "TYPE_MISMATCH",
-                                            f"Expected dict, got {type(item).__name__}"
-                                        )
-                                elif set(item.keys()) != expected_keys:
-                                    if len(self.report.warnings) < self.max_errors:
-                                        missing = expected_keys - set(item.keys())
-                                        extra = set(item.keys()) - expected_keys
-                                        msg = []
-                                        if missing:
-                                            msg.append(f"Missing keys: {missing}")
-                                        if extra:
-                                            msg.append(f"Extra keys: {extra}")
-                                        self.report.add_warning(
-                                            idx,
-                                            "KEY_MISMATCH",
-                                            "; ".join(msg)
-                                        )
-                    
-                    elif isinstance(data, dict):
-                        self.report.total_rows = 1
-                        self.report.valid_rows = 1
-                        self.report.expected_columns = len(data.keys())
-                    
+                    if self._is_array(head):
+                        # Stream top-level arrays item by item instead of loading them whole
+                        self._check_items(self._iter_array(f, head), progress_callback, f)
                     else:
-                        self.report.total_rows = 1
-                        self.report.valid_rows = 1
+                        # Read raw bytes; json.loads detects the encoding itself, which skips
+                        # the incremental decode of a text-mode read
+                        content = head + f.read()
+                        
+                        if progress_callback:
+                            progress_callback(50, 0, len(self.report.errors))
+                        
+                        data = json.loads(content)
+                        
+                        # Analyze structure
+                        if isinstance(data, list):
+                            self._check_items(data)
+                        
+                        elif isinstance(data, dict):
+                            self.report.total_rows = 1
+                            self.report.valid_rows = 1
+                            self.report.expected_columns = len(data.keys())
+                        
+                        else:
+                            self.report.total_rows = 1
+                            self.report.valid_rows = 1
                     
                     if progress_callback:
                         progress_callback(100, self.report.total_rows, len(self.report.errors))
@@ -501,7 +956,9 @@ class JSONValidator:
                 except json.JSONDecodeError as e:
                     self.report.add_error(e.lineno, "JSON_PARSE_ERROR", 
                                         f"Invalid JSON: {str(e)}")
-                    self.report.invalid_rows = 1
+                    # Count the unparseable item (or document) as a row so valid + invalid = total
+                    self.report.total_rows += 1
+                    self.report.invalid_rows += 1
                     
         except Exception as e:
             self.report.add_error(0, "FILE_READ_ERROR", f"Error reading file: {str(e)}")
@@ -511,9 +968,70 @@ class JSONValidator:
         
         return self.report
 
+def create_validator(filepath: str, check_duplicates: bool = False,
+                     cancel_event: Optional[threading.Event] = None, max_workers: Optional[int] = None):
+    """Create the validator for a file's type, chosen by extension."""
+    if os.path.splitext(filepath)[1].lower() == '.json':
+        return JSONValidator(filepath, cancel_event=cancel_event)
+    return DelimitedFileValidator(filepath, check_duplicates=check_duplicates,
+                                  cancel_event=cancel_event, max_workers=max_workers)
+
+def _validate_file(filepath: str, check_duplicates: bool, cancel_event=None) -> ValidationReport:
+    """Validate one file of a batch in a worker process.
+    
+    The batch already runs one file per process, so large files are not split further.
+    """
+    return create_validator(filepath, check_duplicates, cancel_event, max_workers=1).validate()
+
+class BatchValidator:
+    """Validates several files, spreading large batches across worker processes."""
+    
+    PARALLEL_MIN_FILES = 10  # Smaller batches run one file at a time in the calling thread
+    
+    def __init__(self, check_duplicates: bool = False, cancel_event: Optional[threading.Event] = None):
+        self.check_duplicates = check_duplicates
+        self.cancel_event = cancel_event
+    
+    def process(self, filepaths: List[str], progress_callback=None) -> List[Optional[ValidationReport]]:
+        """Validate each file, returning the reports in the order of filepaths.
+        
+        progress_callback(files_done, total_files, report) is called as each file finishes.
+        On cancellation, files that were not validated have None instead of a report.
+        """
+        reports = [None] * len(filepaths)
+        workers = min(os.cpu_count() or 1, len(filepaths))
+        
+        if len(filepaths) < self.PARALLEL_MIN_FILES or workers < 2:
+            for index, filepath in enumerate(filepaths):
+                if self.cancel_event and self.cancel_event.is_set():
+                    break
+                report = create_validator(filepath, self.check_duplicates, self.cancel_event).validate()
+                reports[index] = report
+                if progress_callback:
+                    progress_callback(index + 1, len(filepaths), report)
+            return reports
+        
+        files_done = 0
+        
+        def collect(index, report):
+            nonlocal files_done
+            reports[index] = report
+            files_done += 1
+            if progress_callback:
+                progress_callback(files_done, len(filepaths), report)
+        
+        task_args = [(filepath, self.check_duplicates) for filepath in filepaths]
+        _run_in_processes(_validate_file, task_args, workers, self.cancel_event, collect)
+        
+        return reports
+
 class DataValidatorApp:
     """Main application class with tkinter UI."""
     
+    TABLE_BATCH_SIZE = 50  # Error table rows inserted per idle callback
+    PROGRESS_POLL_MS = 33  # Milliseconds between progress refreshes while validating (~30/sec)
+    REPORT_CACHE_SIZE = 16  # Reports kept for files that have not changed since validation
+    
     def __init__(self, root):
         self.root = root
         self.root.title("File Proof")
@@ -531,6 +1049,24 @@ class DataValidatorApp:
                        lightcolor='#81C784',
                        darkcolor='#388E3C')
         
+        # Progress bar variants for each validation state, switched with configure(style=...)
+        style.configure("Running.Colorful.Horizontal.TProgressbar",
+                       background='#2196F3',  # Blue
+                       lightcolor='#64B5F6',
+                       darkcolor='#1976D2')
+        style.configure("Passed.Colorful.Horizontal.TProgressbar",
+                       background='#4CAF50',  # Green
+                       lightcolor='#81C784',
+                       darkcolor='#388E3C')
+        style.configure("Failed.Colorful.Horizontal.TProgressbar",
+                       background='#F44336',  # Red
+                       lightcolor='#E57373',
+                       darkcolor='#D32F2F')
+        style.configure("Cancelled.Colorful.Horizontal.TProgressbar",
+                       background='#FF9800',  # Orange
+                       lightcolor='#FFB74D',
+                       darkcolor='#F57C00')
+        
         # Create accent button style (Green)
         style.configure('Accent.TButton',
                        background='#A5D6A7',  # Light Green
@@ -551,16 +1087,30 @@ class DataValidatorApp:
         style.map('Cancel.TButton',
                  background=[('active', '#EF5350'), ('disabled', '#E0E0E0')])
         
+        # Small gray note text used in dialogs
+        style.configure('Note.TLabel',
+                       foreground='gray',
+                       font=('Helvetica', 8))
+        
         # Variables
         self.filepath = tk.StringVar()
         self.validation_running = False
+        self.save_running = False
+        self.progress_queue = deque(maxlen=1)  # Latest progress posted by the validation thread
         self.current_report = None
         self.progress_color_state = 0
         self.all_errors = []  # For error navigator
         self.all_duplicates = []  # For duplicate tracking
+        self.table_entries = []  # Errors then duplicates; a table row's iid is its index here
+        self.table_values = []  # Formatted column values for each entry, built once per report
+        self.iids_by_row = {}  # Row number -> iids of its table rows
+        self.iids_by_type = {}  # Error type -> iids of its table rows, in report order
         self.check_duplicates = tk.BooleanVar(value=True)
         self.cancel_event = threading.Event()  # For cancelling validation
         self.validation_completed = False  # Track if full validation completed (not cancelled)
+        self.inserted_rows = 0  # Table rows inserted so far; iids "0".."n-1", attached or not
+        self.pending_job = None
+        self.report_cache = OrderedDict()  # (path, mtime, size, duplicates) -> (report, navigator data)
         
         self.setup_ui()
         
@@ -610,9 +1160,13 @@ class DataValidatorApp:
         
         # Duplicate detection checkbox
         ttk.Checkbutton(file_frame, text="Check for duplicate rows", 
-                       variable=self.check_duplicates).grid(row=1, column=0, columnspan=4, 
+                       variable=self.check_duplicates).grid(row=1, column=0, columnspan=3, 
                                                             sticky=tk.W, pady=(5, 0))
         
+        # Batch validation of several files
+        ttk.Button(file_frame, text="Batch...", command=self.start_batch_validation).grid(
+            row=1, column=3, columnspan=2, sticky=tk.E, pady=(5, 0))
+        
         # Progress frame
         progress_frame = ttk.Frame(main_frame)
         progress_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
@@ -767,7 +1321,10 @@ class DataValidatorApp:
             messagebox.showerror("Error", "Please select a file to validate")
             return
         
-        if not os.path.exists(self.filepath.get()):
+        # One stat both checks that the file exists and keys the report cache
+        try:
+            cache_key = self.get_cache_key(self.filepath.get())
+        except OSError:
             messagebox.showerror("Error", "Selected file does not exist")
             return
         
@@ -783,10 +1340,161 @@ class DataValidatorApp:
         self.fix_save_btn.config(state='disabled')  # Disable Fix & Save until validation completes
         self.clear_results()
         
+        # Reuse the report from an earlier run if the file has not changed since
+        cached = self.report_cache.get(cache_key)
+        if cached is not None:
+            self.report_cache.move_to_end(cache_key)
+            report, navigator_data = cached
+            self.last_validated_file = self.filepath.get()
+            self.current_report = report
+            self.validation_running = False
+            self.display_results(report, navigator_data)
+            return
+        
         # Run validation in separate thread
-        thread = threading.Thread(target=self.run_validation)
+        thread = threading.Thread(target=self.run_validation, args=(cache_key,))
+        thread.daemon = True
+        thread.start()
+        self.root.after(self.PROGRESS_POLL_MS, self.drain_progress)
+    
+    def start_batch_validation(self):
+        """Validate several files in a separate thread and summarize the results."""
+        if self.validation_running:
+            messagebox.showwarning("Warning", "Validation is already running")
+            return
+        
+        filenames = filedialog.askopenfilenames(
+            title="Select data files to validate",
+            filetypes=[
+                ("All Supported", "*.csv *.txt *.dat *.json *.tsv"),
+                ("CSV files", "*.csv"),
+                ("Text files", "*.txt"),
+                ("Data files", "*.dat"),
+                ("JSON files", "*.json"),
+                ("TSV files", "*.tsv"),
+                ("All files", "*.*")
+            ]
+        )
+        if not filenames:
+            return
+        
+        # Take cache keys up front so a file edited during the batch is not cached as current;
+        # the stat also catches files removed or renamed since they were picked
+        filepaths = list(filenames)
+        try:
+            cache_keys = [self.get_cache_key(filepath) for filepath in filepaths]
+        except OSError as e:
+            messagebox.showerror("Error", f"Cannot read selected file: {e.filename or str(e)}")
+            return
+        
+        self.validation_running = True
+        self.validate_btn.config(state='disabled')
+        self.cancel_event.clear()  # Clear any previous cancel signal
+        self.cancel_btn.config(state='normal')  # Enable cancel button
+        self.clear_results()
+        
+        thread = threading.Thread(target=self.run_batch_validation,
+                                  args=(filepaths, cache_keys, self.check_duplicates.get()))
         thread.daemon = True
         thread.start()
+        self.root.after(self.PROGRESS_POLL_MS, self.drain_progress)
+    
+    def run_batch_validation(self, filepaths, cache_keys, check_duplicates):
+        """Run a batch validation, caching each complete report for later viewing."""
+        try:
+            totals = {'rows': 0, 'errors': 0}
+            
+            def progress_callback(files_done, total_files, report):
+                totals['rows'] += report.total_rows
+                totals['errors'] += len(report.errors)
+                self.progress_queue.append((files_done / total_files * 100, totals['rows'], totals['errors']))
+            
+            validator = BatchValidator(check_duplicates=check_duplicates, cancel_event=self.cancel_event)
+            reports = validator.process(filepaths, progress_callback)
+            
+            # Validating a file from the batch afterwards opens its results straight from the cache
+            for cache_key, report in zip(cache_keys, reports):
+                if report is not None:
+                    self.root.after(0, self.cache_report, cache_key, report, self.prepare_error_navigator(report))
+            
+            self.root.after(0, self.show_batch_summary, filepaths, reports)
+        
+        except Exception as e:
+            self.root.after(0, messagebox.showerror, "Error", 
+                          f"Batch validation failed: {str(e)}")
+        finally:
+            self.validation_running = False
+            self.root.after(0, lambda: self.validate_btn.config(state='normal'))
+            self.root.after(0, lambda: self.cancel_btn.config(state='disabled'))
+    
+    def show_batch_summary(self, filepaths, reports):
+        """Show the pass/fail result of each file in a batch."""
+        self.progress_queue.clear()  # Drop progress that arrived after the final update
+        
+        validated = [report for report in reports if report is not None]
+        passed = sum(1 for report in validated if report.passed)
+        if len(validated) < len(filepaths) or any(report.cancelled for report in validated):
+            self.progress_label.config(
+                text=f"⚠ Batch Cancelled - {passed} of {len(filepaths)} file(s) passed",
+                foreground='#FF9800',
+                font=('Helvetica', 10, 'bold')
+            )
+            self.progress_bar.configure(style="Cancelled.Colorful.Horizontal.TProgressbar")
+        elif passed == len(filepaths):
+            self.progress_label.config(
+                text=f"✓ Batch Passed - All {passed} file(s) are valid!",
+                foreground='#4CAF50',
+                font=('Helvetica', 10, 'bold')
+            )
+            self.progress_bar.configure(style="Passed.Colorful.Horizontal.TProgressbar")
+            self.progress_bar['value'] = 100
+        else:
+            self.progress_label.config(
+                text=f"✗ Batch Failed - {len(filepaths) - passed} of {len(filepaths)} file(s) failed",
+                foreground='#F44336',
+                font=('Helvetica', 10, 'bold')
+            )
+            self.progress_bar.configure(style="Failed.Colorful.Horizontal.TProgressbar")
+            self.progress_bar['value'] = 100
+        
+        # Create summary window
+        summary_window = tk.Toplevel(self.root)
+        summary_window.title("Batch Validation Summary")
+        summary_window.geometry("900x600")
+        
+        # Text widget with scrollbar
+        frame = ttk.Frame(summary_window, padding="10")
+        frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        summary_window.columnconfigure(0, weight=1)
+        summary_window.rowconfigure(0, weight=1)
+        frame.columnconfigure(0, weight=1)
+        frame.rowconfigure(0, weight=1)
+        
+        text_widget = scrolledtext.ScrolledText(frame, wrap=tk.WORD, font=('Courier', 9))
+        text_widget.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        parts = []
+        for filepath, report in zip(filepaths, reports):
+            if report is None:
+                status = "- NOT VALIDATED"
+            elif report.cancelled:
+                status = "⚠ CANCELLED"
+            elif report.passed:
+                status = "✓ PASSED"
+            else:
+                status = "✗ FAILED"
+            parts.append(f"{status}  {filepath}\n")
+            if report is not None:
+                parts.append(f"    Rows: {report.total_rows:,}  Errors: {len(report.errors)}  "
+                             f"Warnings: {len(report.warnings)}  Duplicates: {len(report.duplicates)}\n")
+        parts.append("\nSelect a file and click Validate File to open its results in the Error Navigator.\n")
+        text_widget.insert('end', ''.join(parts))
+        
+        text_widget.config(state='disabled')
+        
+        # Close button
+        ttk.Button(frame, text="Close", command=summary_window.destroy).grid(
+            row=1, column=0, pady=(10, 0))
     
     def cancel_validation(self):
         """Cancel the currently running validation."""
@@ -794,48 +1502,44 @@ class DataValidatorApp:
             self.cancel_event.set()  # Signal cancellation
             self.cancel_btn.config(state='disabled')
     
-    def run_validation(self):
+    def get_cache_key(self, filepath):
+        """Build the report cache key from the file's identity and the validation settings."""
+        stat = os.stat(filepath)
+        return (os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size, self.check_duplicates.get())
+    
+    def cache_report(self, cache_key, report, navigator_data):
+        """Remember a completed report, evicting the least recently used one when full."""
+        # Only cache complete reads; a locked or unreadable file should be retried next time
+        if report.cancelled or any(error['type'] == 'FILE_READ_ERROR' for error in report.errors):
+            return
+        self.report_cache[cache_key] = (report, navigator_data)
+        self.report_cache.move_to_end(cache_key)
+        while len(self.report_cache) > self.REPORT_CACHE_SIZE:
+            self.report_cache.popitem(last=False)
+    
+    def run_validation(self, cache_key=None):
         """Run the validation process."""
         filepath = self.filepath.get()
         
         # Store the filepath for save operations
         self.last_validated_file = filepath
         
-        # Always auto-detect file type and delimiter
-        filetype = "auto"
-        delimiter = None
-        
-        # Reset progress bar to starting color
-        style = ttk.Style()
-        style.configure("Colorful.Horizontal.TProgressbar",
-                      background='#2196F3',
-                      lightcolor='#64B5F6',
-                      darkcolor='#1976D2')
-        
         try:
-            # Determine file type
-            if filetype == "auto":
-                ext = os.path.splitext(filepath)[1].lower()
-                if ext == '.json':
-                    filetype = 'json'
-                else:
-                    filetype = 'delimited'
-            
-            # Create appropriate validator
-            if filetype == 'json':
-                validator = JSONValidator(filepath, cancel_event=self.cancel_event)
-            else:
-                validator = DelimitedFileValidator(filepath, delimiter=delimiter, check_duplicates=self.check_duplicates.get(), cancel_event=self.cancel_event)
+            # Create appropriate validator for the file type; the delimiter is always auto-detected
+            validator = create_validator(filepath, check_duplicates=self.check_duplicates.get(),
+                                         cancel_event=self.cancel_event)
             
-            # Run validation with progress updates
-            def progress_callback(progress, rows, errors):
-                self.root.after(0, self.update_progress, progress, rows, errors)
-            
-            report = validator.validate(progress_callback)
+            # Run validation, posting progress for the UI thread to pick up
+            report = validator.validate(lambda *progress: self.progress_queue.append(progress))
             self.current_report = report
             
+            # Format and index the results here so the UI thread only has to insert them
+            navigator_data = self.prepare_error_navigator(report)
+            if cache_key is not None:
+                self.root.after(0, self.cache_report, cache_key, report, navigator_data)
+            
             # Display results
-            self.root.after(0, self.display_results, report)
+            self.root.after(0, self.display_results, report, navigator_data)
             
         except Exception as e:
             self.root.after(0, messagebox.showerror, "Error", 
@@ -845,6 +1549,13 @@ class DataValidatorApp:
             self.root.after(0, lambda: self.validate_btn.config(state='normal'))
             self.root.after(0, lambda: self.cancel_btn.config(state='disabled'))
     
+    def drain_progress(self):
+        """Show the latest progress from the validation thread, polling again while it runs."""
+        if self.progress_queue:
+            self.update_progress(*self.progress_queue.pop())
+        if self.validation_running:
+            self.root.after(self.PROGRESS_POLL_MS, self.drain_progress)
+    
     def update_progress(self, progress, rows, errors=0):
         """Update the progress bar and label - stays blue while processing."""
         self.progress_bar['value'] = progress
@@ -858,13 +1569,12 @@ class DataValidatorApp:
         
         # Keep progress bar blue during processing
         # Color will change to green/red only when validation completes
-        
-        self.root.update_idletasks()
     
-    def display_results(self, report: ValidationReport):
+    def display_results(self, report: ValidationReport, navigator_data=None):
         """Display validation results in the error navigator."""
         # Re-enable validate button and disable cancel button
         self.validation_running = False
+        self.progress_queue.clear()  # Drop progress that arrived after the final update
         self.validate_btn.config(state='normal')
         self.cancel_btn.config(state='disabled')
         
@@ -898,11 +1608,7 @@ class DataValidatorApp:
                 font=('Helvetica', 10, 'bold')
             )
             # Set progress bar to orange for cancellation
-            style = ttk.Style()
-            style.configure("Colorful.Horizontal.TProgressbar",
-                          background='#FF9800',
-                          lightcolor='#FFB74D',
-                          darkcolor='#F57C00')
+            self.progress_bar.configure(style="Cancelled.Colorful.Horizontal.TProgressbar")
         elif report.passed:
             self.progress_label.config(
                 text="✓ Validation Passed - File is Valid!", 
@@ -910,11 +1616,7 @@ class DataValidatorApp:
                 font=('Helvetica', 10, 'bold')
             )
             # Set progress bar to green for success
-            style = ttk.Style()
-            style.configure("Colorful.Horizontal.TProgressbar",
-                          background='#4CAF50',
-                          lightcolor='#81C784',
-                          darkcolor='#388E3C')
+            self.progress_bar.configure(style="Passed.Colorful.Horizontal.TProgressbar")
             self.progress_bar['value'] = 100
         else:
             self.progress_label.config(
@@ -923,68 +1625,106 @@ class DataValidatorApp:
                 font=('Helvetica', 10, 'bold')
             )
             # Set progress bar to red for failure
-            style = ttk.Style()
-            style.configure("Colorful.Horizontal.TProgressbar",
-                          background='#F44336',
-                          lightcolor='#E57373',
-                          darkcolor='#D32F2F')
+            self.progress_bar.configure(style="Failed.Colorful.Horizontal.TProgressbar")
             self.progress_bar['value'] = 100
         
         # Populate error navigator
-        self.populate_error_navigator(report)
+        self.populate_error_navigator(report, navigator_data)
     
-    def populate_error_navigator(self, report: ValidationReport):
+    def prepare_error_navigator(self, report: ValidationReport) -> Tuple:
+        """Format and index a report's errors and duplicates for the error navigator.
+        
+        Only reads the report, so it can run on the validation thread.
+        """
+        # Errors then duplicates; a table row's iid is its index here
+        entries = report.errors + report.duplicates
+        
+        # Format each row's values once and index table rows by row number and type
+        values = []
+        iids_by_row = {}
+        iids_by_type = {}
+        for index, entry in enumerate(entries):
+            iid = str(index)
+            preview = self.format_preview(entry.get('content', ''))
+            values.append((entry['row'], entry['type'], entry['description'], preview))
+            iids_by_row.setdefault(entry['row'], []).append(iid)
+            iids_by_type.setdefault(entry['type'], []).append(iid)
+        
+        # Get unique error types for filter from the type index built above
+        error_types = ['All Errors']
+        error_types.extend(sorted(error_type for error_type in iids_by_type if error_type != 'DUPLICATE_ROW'))
+        if report.duplicates:
+            error_types.append('DUPLICATE_ROW')
+        
+        return entries, values, iids_by_row, iids_by_type, error_types
+    
+    def populate_error_navigator(self, report: ValidationReport, navigator_data=None):
         """Populate the error navigator table with errors from the report."""
-        # Clear existing items
-        for item in self.error_table.get_children():
-            self.error_table.delete(item)
+        if navigator_data is None:
+            navigator_data = self.prepare_error_navigator(report)
         
         # Store errors for filtering/sorting
         self.all_errors = report.errors
         self.all_duplicates = report.duplicates
-        
-        # Get unique error types for filter
-        error_types = ['All Errors']
-        if self.all_errors:
-            unique_types = sorted(set(error['type'] for error in self.all_errors))
-            error_types.extend(unique_types)
-        if self.all_duplicates:
-            error_types.append('DUPLICATE_ROW')
+        self.table_entries, self.table_values, self.iids_by_row, self.iids_by_type, error_types = navigator_data
         
         self.filter_combo['values'] = error_types
         self.error_filter.set('All Errors')
         
         # Populate table
-        for error in self.all_errors:
-            preview = error.get('content', '')[:100]  # First 100 chars
-            if len(error.get('content', '')) > 100:
-                preview += '...'
-            
-            self.error_table.insert('', 'end', values=(
-                error['row'],
-                error['type'],
-                error['description'],
-                preview
-            ))
-        
-        # Add duplicates to table
-        for duplicate in self.all_duplicates:
-            preview = duplicate.get('content', '')[:100]
-            if len(duplicate.get('content', '')) > 100:
-                preview += '...'
-            
-            self.error_table.insert('', 'end', values=(
-                duplicate['row'],
-                duplicate['type'],
-                duplicate['description'],
-                preview
-            ))
-        
+        self.show_error_rows()
         
         # Update stats
         self.update_error_stats()
         self.update_duplicate_stats()
     
+    @staticmethod
+    def format_preview(content):
+        """Shorten row content to the first 100 characters for the table."""
+        if len(content) <= 100:
+            return content
+        return content[:100] + '...'
+    
+    def show_error_rows(self):
+        """Replace the table contents, inserting rows in batches during idle time."""
+        self.clear_error_table()
+        self.insert_pending_rows()
+    
+    def insert_pending_rows(self, batch_size=None):
+        """Insert the next batch of table rows and schedule the rest."""
+        values = self.table_values
+        start = self.inserted_rows
+        end = min(len(values), start + (batch_size or self.TABLE_BATCH_SIZE))
+        insert = self.error_table.insert
+        for index in range(start, end):
+            insert('', 'end', iid=str(index), values=values[index])
+        self.inserted_rows = end
+        
+        if end < len(values):
+            self.pending_job = self.root.after_idle(self.insert_pending_rows)
+        else:
+            self.pending_job = None
+    
+    def flush_pending_rows(self):
+        """Insert all remaining rows now, for actions that need the complete table."""
+        if self.pending_job is not None:
+            self.root.after_cancel(self.pending_job)
+            self.pending_job = None
+            self.insert_pending_rows(len(self.table_values))
+    
+    def clear_error_table(self):
+        """Delete every table row, including rows detached by the filter."""
+        if self.pending_job is not None:
+            self.root.after_cancel(self.pending_job)
+            self.pending_job = None
+        self.error_table.delete(*(str(index) for index in range(self.inserted_rows)))
+        self.inserted_rows = 0
+    
+    def is_row_shown(self, iid):
+        """Whether a table row passes the current type filter."""
+        filter_type = self.error_filter.get()
+        return filter_type == 'All Errors' or self.table_values[int(iid)][1] == filter_type
+    
     def update_error_stats(self):
         """Update the error statistics label."""
         total_errors = len(self.all_errors) if hasattr(self, 'all_errors') else 0
@@ -1015,41 +1755,14 @@ class DataValidatorApp:
         if not hasattr(self, 'all_errors'):
             return
         
-        # Clear table
-        for item in self.error_table.get_children():
-            self.error_table.delete(item)
-        
+        # Rows are inserted once; filtering only changes which ones are attached, in report order
+        self.flush_pending_rows()
         filter_type = self.error_filter.get()
-        
-        # Repopulate with filtered errors
-        for error in self.all_errors:
-            if filter_type == 'All Errors' or error['type'] == filter_type:
-                preview = error.get('content', '')[:100]
-                if len(error.get('content', '')) > 100:
-                    preview += '...'
-                
-                self.error_table.insert('', 'end', values=(
-                    error['row'],
-                    error['type'],
-                    error['description'],
-                    preview
-                ))
-        
-        # Also add filtered duplicates
-        if hasattr(self, 'all_duplicates'):
-            for duplicate in self.all_duplicates:
-                if filter_type == 'All Errors' or duplicate['type'] == filter_type:
-                    preview = duplicate.get('content', '')[:100]
-                    if len(duplicate.get('content', '')) > 100:
-                        preview += '...'
-                    
-                    self.error_table.insert('', 'end', values=(
-                        duplicate['row'],
-                        duplicate['type'],
-                        duplicate['description'],
-                        preview
-                    ))
-        
+        if filter_type == 'All Errors':
+            shown = [str(index) for index in range(len(self.table_values))]
+        else:
+            shown = self.iids_by_type.get(filter_type, [])
+        self.error_table.set_children('', *shown)
         
         self.update_error_stats()
     
@@ -1067,19 +1780,17 @@ class DataValidatorApp:
             messagebox.showerror("Search", "Please enter a valid row number")
             return
         
-        # Search in table
-        found = False
-        for item in self.error_table.get_children():
-            values = self.error_table.item(item)['values']
-            if values[0] == row_num:
-                # Select and show the item
-                self.error_table.selection_set(item)
-                self.error_table.see(item)
-                self.error_table.focus(item)
-                found = True
-                break
+        # Look up the row's table entries and pick the first one currently shown
+        self.flush_pending_rows()
+        shown = [iid for iid in self.iids_by_row.get(row_num, ()) if self.is_row_shown(iid)]
         
-        if not found:
+        if shown:
+            item = min(shown, key=self.error_table.index)
+            # Select and show the item
+            self.error_table.selection_set(item)
+            self.error_table.see(item)
+            self.error_table.focus(item)
+        else:
             messagebox.showinfo("Search", f"Row {row_num} not found in error list")
     
     def sort_errors(self, column):
@@ -1091,22 +1802,20 @@ class DataValidatorApp:
             self.sort_column = column
             self.sort_reverse = False
         
-        # Get all items
-        items = [(self.error_table.item(item)['values'], item) 
-                 for item in self.error_table.get_children()]
+        # Sort the shown iids using the Python-side data instead of reading values back from Tk
+        self.flush_pending_rows()
+        entries = self.table_entries
+        items = self.error_table.get_children()
         
-        # Determine column index
-        col_index = {'row': 0, 'type': 1, 'description': 2, 'preview': 3}[column]
-        
-        # Sort items
         if column == 'row':
-            items.sort(key=lambda x: int(x[0][col_index]), reverse=self.sort_reverse)
+            key = lambda item: entries[int(item)]['row']
+        elif column == 'preview':
+            key = lambda item: self.table_values[int(item)][3].lower()
         else:
-            items.sort(key=lambda x: str(x[0][col_index]).lower(), reverse=self.sort_reverse)
+            key = lambda item: str(entries[int(item)][column]).lower()
         
-        # Reinsert items in sorted order
-        for index, (values, item) in enumerate(items):
-            self.error_table.move(item, '', index)
+        # Reorder all items in a single Tcl call
+        self.error_table.set_children('', *sorted(items, key=key, reverse=self.sort_reverse))
     
     def show_error_detail(self, event):
         """Show detailed information for selected error or duplicate (double-click)."""
@@ -1115,30 +1824,12 @@ class DataValidatorApp:
             return
         
         item = selection[0]
-        values = self.error_table.item(item)['values']
-        
-        # Find the full error or duplicate data
-        row_num = values[0]
-        error_type = values[1]
-        data = None
-        is_duplicate = False
-        
-        # First check in errors
-        for error in self.all_errors:
-            if error['row'] == row_num and error['type'] == error_type:
-                data = error
-                break
         
-        # If not found in errors, check duplicates
-        if not data:
-            for duplicate in self.all_duplicates:
-                if duplicate['row'] == row_num:
-                    data = duplicate
-                    is_duplicate = True
-                    break
-        
-        if not data:
-            return
+        # The iid indexes the full error or duplicate data
+        index = int(item)
+        data = self.table_entries[index]
+        is_duplicate = index >= len(self.all_errors)
+        row_num = data['row']
         
         # Create detail window
         detail_window = tk.Toplevel(self.root)
@@ -1207,24 +1898,28 @@ class DataValidatorApp:
         text_widget = scrolledtext.ScrolledText(frame, wrap=tk.WORD, font=('Courier', 9))
         text_widget.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
-        # Build detailed text
+        # Build detailed text; each shown row maps to the first error reported for its row number
+        self.flush_pending_rows()
+        error_count = len(self.all_errors)
         visible_errors = []
         for item in self.error_table.get_children():
-            row_num = self.error_table.item(item)['values'][0]
-            for error in self.all_errors:
-                if error['row'] == row_num:
-                    visible_errors.append(error)
-                    break
+            row_num = self.table_values[int(item)][0]
+            # Errors come before duplicates in table_entries, so the row's first iid is its first error if any
+            first = int(self.iids_by_row[row_num][0])
+            if first < error_count:
+                visible_errors.append(self.all_errors[first])
         
+        parts = []
         for i, error in enumerate(visible_errors, 1):
-            text_widget.insert('end', f"{'=' * 80}\n")
-            text_widget.insert('end', f"ERROR #{i}\n")
-            text_widget.insert('end', f"{'=' * 80}\n")
-            text_widget.insert('end', f"Row Number: {error['row']}\n")
-            text_widget.insert('end', f"Error Type: {error['type']}\n")
-            text_widget.insert('end', f"Description: {error['description']}\n")
-            text_widget.insert('end', f"\nRow Content:\n")
-            text_widget.insert('end', f"{error.get('content', 'No content available')}\n\n")
+            parts.append(f"{'=' * 80}\n")
+            parts.append(f"ERROR #{i}\n")
+            parts.append(f"{'=' * 80}\n")
+            parts.append(f"Row Number: {error['row']}\n")
+            parts.append(f"Error Type: {error['type']}\n")
+            parts.append(f"Description: {error['description']}\n")
+            parts.append(f"\nRow Content:\n")
+            parts.append(f"{error.get('content', 'No content available')}\n\n")
+        text_widget.insert('end', ''.join(parts))
         
         text_widget.config(state='disabled')
         
@@ -1234,23 +1929,22 @@ class DataValidatorApp:
     
     def copy_error_rows(self):
         """Copy row numbers of visible errors to clipboard."""
-        if not self.error_table.get_children():
+        self.flush_pending_rows()
+        items = self.error_table.get_children()
+        if not items:
             messagebox.showinfo("Copy Row Numbers", "No errors to copy")
             return
         
-        # Get all visible row numbers
-        row_numbers = []
-        for item in self.error_table.get_children():
-            values = self.error_table.item(item)['values']
-            row_numbers.append(str(values[0]))
+        # Get all visible row numbers from the Python-side values, in display order
+        values = self.table_values
+        row_list = ', '.join([str(values[int(item)][0]) for item in items])
         
         # Copy to clipboard
-        row_list = ', '.join(row_numbers)
         self.root.clipboard_clear()
         self.root.clipboard_append(row_list)
         
         messagebox.showinfo("Copy Row Numbers", 
-                          f"Copied {len(row_numbers)} row number(s) to clipboard:\n{row_list[:200]}...")
+                          f"Copied {len(items)} row number(s) to clipboard:\n{row_list[:200]}...")
     
     def export_errors(self):
         """Export visible errors to CSV file."""
@@ -1303,10 +1997,13 @@ class DataValidatorApp:
         self.progress_bar['value'] = 0
         
         # Clear error navigator
-        for item in self.error_table.get_children():
-            self.error_table.delete(item)
+        self.clear_error_table()
         self.all_errors = []
         self.all_duplicates = []
+        self.table_entries = []
+        self.table_values = []
+        self.iids_by_row = {}
+        self.iids_by_type = {}
         self.error_filter.set('All Errors')
         self.error_stats_label.config(text="No errors")
         self.duplicate_stats_label.config(text="")
@@ -1322,11 +2019,7 @@ class DataValidatorApp:
         self.clear_btn.config(state='disabled')
         
         # Reset progress bar to default blue color
-        style = ttk.Style()
-        style.configure("Colorful.Horizontal.TProgressbar",
-                      background='#2196F3',
-                      lightcolor='#64B5F6',
-                      darkcolor='#1976D2')
+        self.progress_bar.configure(style="Running.Colorful.Horizontal.TProgressbar")
     
     def open_documentation(self):
         """Open the documentation URL in the default browser."""
@@ -1345,6 +2038,10 @@ class DataValidatorApp:
             messagebox.showwarning("Save", "Original file path not available.")
             return
         
+        if self.save_running:
+            messagebox.showwarning("Save", "A save is already in progress. Please wait for it to finish.")
+            return
+        
         # Check if validation completed without cancellation
         if not self.validation_completed or (hasattr(self.current_report, 'cancelled') and self.current_report.cancelled):
             messagebox.showwarning("Save", "Cannot use Fix & Save on an incomplete validation. Please run a complete validation scan first.")
@@ -1413,15 +2110,16 @@ class DataValidatorApp:
         
         # Info label
         info_text = "Note: 'Export file without error records' & 'Remove duplicate records' will save to the same file if both are selected."
-        ttk.Label(main_frame, text=info_text, foreground='gray', 
-                 font=('Helvetica', 8), wraplength=380).grid(row=3, column=0, sticky=tk.W, pady=(15, 0))
+        ttk.Label(main_frame, text=info_text, style='Note.TLabel',
+                 wraplength=380).grid(row=3, column=0, sticky=tk.W, pady=(15, 0))
         
         # Button frame
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(row=4, column=0, pady=(20, 0))
         
         def on_save():
-            if not self.save_without_errors_var.get() and not self.remove_duplicates_var.get() and not self.export_errors_var.get() and not self.export_duplicates_var.get():
+            if not any(var.get() for var in (self.save_without_errors_var, self.remove_duplicates_var,
+                                             self.export_errors_var, self.export_duplicates_var)):
                 messagebox.showwarning("Save", "Please select at least one option.")
                 return
             dialog.destroy()
@@ -1430,21 +2128,23 @@ class DataValidatorApp:
         ttk.Button(button_frame, text="Save", command=on_save).grid(row=0, column=0, padx=5)
         ttk.Button(button_frame, text="Cancel", command=dialog.destroy).grid(row=0, column=1, padx=5)
     
+    @staticmethod
+    def _rows_in_range(rows: List[int], first: int, end: int) -> List[int]:
+        """Return the row numbers from the sorted list rows that fall in [first, end)."""
+        return rows[bisect.bisect_left(rows, first):bisect.bisect_left(rows, end)]
+    
     def perform_save_operation(self):
         """Perform the selected save operations."""
         try:
             # Get error and duplicate row numbers
             error_rows = set(error['row'] for error in self.current_report.errors)
             duplicate_rows = set(dup['row'] for dup in self.current_report.duplicates)
+            base_name = os.path.splitext(os.path.basename(self.last_validated_file))[0]
             
-            # Read the original file
-            with open(self.last_validated_file, 'r', encoding='utf-8', errors='replace') as f:
-                lines = f.readlines()
-            
-            # Get delimiter from the report
-            delimiter = self.current_report.delimiter if hasattr(self.current_report, 'delimiter') and self.current_report.delimiter else ','
-            
-            saved_files = []
+            # Ask for every output file first so the original file is read in a single pass
+            clean_filename = None
+            errors_filename = None
+            duplicates_filename = None
             
             # Option 1 & 2 Combined: Export file without errors and/or duplicates
             if self.save_without_errors_var.get() or self.remove_duplicates_var.get():
@@ -1457,20 +2157,16 @@ class DataValidatorApp:
                     description_parts.append("errors")
                 
                 if self.remove_duplicates_var.get():
-                    # Group duplicates by their content to keep only the first occurrence
-                    duplicate_groups = defaultdict(list)
+                    # Keep the first occurrence of each duplicated content and exclude the rest.
+                    # Duplicates are listed by group in order of first occurrence, rows ascending,
+                    # so the first one seen for a content is always its earliest row.
+                    seen_content = set()
                     for dup in self.current_report.duplicates:
-                        # Use content as key to group duplicates
                         content_key = dup.get('content', '')
-                        duplicate_groups[content_key].append(dup['row'])
-                    
-                    # For each group, exclude all but the first occurrence
-                    for content_key, row_numbers in duplicate_groups.items():
-                        if len(row_numbers) > 0:
-                            # Sort to ensure we keep the first occurrence
-                            sorted_rows = sorted(row_numbers)
-                            # Add all except the first to exclude_rows
-                            exclude_rows.update(sorted_rows[1:])
+                        if content_key in seen_content:
+                            exclude_rows.add(dup['row'])
+                        else:
+                            seen_content.add(content_key)
                     
                     description_parts.append("duplicates")
                 
@@ -1478,79 +2174,133 @@ class DataValidatorApp:
                 if len(description_parts) == 2:
                     title = "Save File Without Errors and Duplicates"
                     suffix = "_clean"
-                    file_description = "File without errors and duplicates"
+                    clean_description = "File without errors and duplicates"
                 elif "errors" in description_parts:
                     title = "Save File Without Errors"
                     suffix = "_no_errors"
-                    file_description = "File without errors"
+                    clean_description = "File without errors"
                 else:
                     title = "Save File Without Duplicates"
                     suffix = "_no_duplicates"
-                    file_description = "File without duplicates"
+                    clean_description = "File without duplicates"
                 
-                filename = filedialog.asksaveasfilename(
+                clean_filename = filedialog.asksaveasfilename(
                     title=title,
                     defaultextension=".csv",
                     filetypes=[("CSV files", "*.csv"), ("Text files", "*.txt"), ("All files", "*.*")],
-                    initialfile=f"{os.path.splitext(os.path.basename(self.last_validated_file))[0]}{suffix}.csv"
+                    initialfile=f"{base_name}{suffix}.csv"
                 )
-                
-                if filename:
-                    with open(filename, 'w', encoding='utf-8', newline='') as f:
-                        for i, line in enumerate(lines, 1):
-                            if i not in exclude_rows:
-                                f.write(line)
-                    saved_files.append(f"{file_description}: {filename}")
             
             # Option 3: Export error records
             if self.export_errors_var.get():
-                filename = filedialog.asksaveasfilename(
+                errors_filename = filedialog.asksaveasfilename(
                     title="Save Error Records Only",
                     defaultextension=".csv",
                     filetypes=[("CSV files", "*.csv"), ("Text files", "*.txt"), ("All files", "*.*")],
-                    initialfile=f"{os.path.splitext(os.path.basename(self.last_validated_file))[0]}_errors_only.csv"
+                    initialfile=f"{base_name}_errors_only.csv"
                 )
-                
-                if filename:
-                    with open(filename, 'w', encoding='utf-8', newline='') as f:
-                        # Write header if it exists (row 1)
-                        if len(lines) > 0 and 1 not in error_rows:
-                            f.write(lines[0])
-                        
-                        # Write only error rows
-                        for i, line in enumerate(lines, 1):
-                            if i in error_rows:
-                                f.write(line)
-                    saved_files.append(f"Error records only: {filename}")
             
             # Option 4: Export duplicate records
             if self.export_duplicates_var.get():
-                filename = filedialog.asksaveasfilename(
+                duplicates_filename = filedialog.asksaveasfilename(
                     title="Save Duplicate Records Only",
                     defaultextension=".csv",
                     filetypes=[("CSV files", "*.csv"), ("Text files", "*.txt"), ("All files", "*.*")],
-                    initialfile=f"{os.path.splitext(os.path.basename(self.last_validated_file))[0]}_duplicates_only.csv"
+                    initialfile=f"{base_name}_duplicates_only.csv"
                 )
+            
+            if not (clean_filename or errors_filename or duplicates_filename):
+                return
+            
+            # The outputs are opened for writing while the original is still being read,
+            # so saving over the original would truncate it before it is copied
+            for target in (clean_filename, errors_filename, duplicates_filename):
+                if target and os.path.exists(target) and os.path.samefile(self.last_validated_file, target):
+                    messagebox.showerror("Save Error",
+                                         f"Cannot save over the original file:\n{target}\n\n"
+                                         "Please choose a different file name.")
+                    return
+            
+            saved_files = []
+            if clean_filename:
+                saved_files.append(f"{clean_description}: {clean_filename}")
+            if errors_filename:
+                saved_files.append(f"Error records only: {errors_filename}")
+            if duplicates_filename:
+                saved_files.append(f"Duplicate records only: {duplicates_filename}")
+            
+            # The record exports always start with the header (row 1)
+            exclude_list = sorted(exclude_rows) if clean_filename else []
+            error_list = sorted(error_rows | {1})
+            duplicate_list = sorted(duplicate_rows | {1})
+            
+            # Write the files in a separate thread so the window stays responsive
+            self.save_running = True
+            thread = threading.Thread(target=self.write_save_files,
+                                      args=(self.last_validated_file, clean_filename, exclude_list,
+                                            errors_filename, error_list, duplicates_filename,
+                                            duplicate_list, saved_files))
+            thread.daemon = True
+            thread.start()
+        
+        except Exception as e:
+            messagebox.showerror("Save Error", f"Failed to save files: {str(e)}")
+    
+    def write_save_files(self, source_path, clean_filename, exclude_list, errors_filename, error_list,
+                         duplicates_filename, duplicate_list, saved_files):
+        """Write the selected save files from the original file (runs in the save thread).
+        
+        The row lists are sorted; the clean file gets every row except those in exclude_list
+        and the record exports get only the rows in their lists.
+        """
+        try:
+            # With nothing to exclude the clean file is a plain copy, which the OS can do on its own
+            if clean_filename and not exclude_list:
+                shutil.copyfile(source_path, clean_filename)
+                clean_filename = None
+            
+            # Stream the original file once, writing each line to every output that wants it
+            with contextlib.ExitStack() as stack:
+                # Lines are copied as raw bytes, so the output keeps the original encoding and
+                # line endings, and rows split at the same line breaks the validator counted
+                buffering = 1024 * 1024
+                source = stack.enter_context(open(source_path, 'rb'))
+                data = b''  # Left empty when only the plain copy was wanted; empty files cannot be mapped
+                if (clean_filename or errors_filename or duplicates_filename) and os.fstat(source.fileno()).st_size:
+                    data = stack.enter_context(mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ))
+                clean_file = errors_file = duplicates_file = None
+                if clean_filename:
+                    clean_file = stack.enter_context(open(clean_filename, 'wb', buffering=buffering))
+                if errors_filename:
+                    errors_file = stack.enter_context(open(errors_filename, 'wb', buffering=buffering))
+                if duplicates_filename:
+                    duplicates_file = stack.enter_context(open(duplicates_filename, 'wb', buffering=buffering))
                 
-                if filename:
-                    with open(filename, 'w', encoding='utf-8', newline='') as f:
-                        # Write header if it exists (row 1)
-                        if len(lines) > 0 and 1 not in duplicate_rows:
-                            f.write(lines[0])
-                        
-                        # Write only duplicate rows
-                        for i, line in enumerate(lines, 1):
-                            if i in duplicate_rows:
-                                f.write(line)
-                    saved_files.append(f"Duplicate records only: {filename}")
+                # Work through about a buffer's worth of lines at a time, with one write per output.
+                # Only the listed rows are touched, so the cost per batch is a join, not a loop.
+                first = 1  # Row number of the batch's first line
+                for _, lines in _iter_line_batches(data, batch_size=buffering):
+                    end = first + len(lines)
+                    if errors_file:
+                        errors_file.write(b''.join([lines[row - first] for row in
+                                                    self._rows_in_range(error_list, first, end)]))
+                    if duplicates_file:
+                        duplicates_file.write(b''.join([lines[row - first] for row in
+                                                        self._rows_in_range(duplicate_list, first, end)]))
+                    if clean_file:
+                        for row in self._rows_in_range(exclude_list, first, end):
+                            lines[row - first] = b''
+                        clean_file.write(b''.join(lines))
+                    first = end
             
             # Show success message
-            if saved_files:
-                message = "Successfully saved:\n\n" + "\n".join(saved_files)
-                messagebox.showinfo("Save Complete", message)
+            message = "Successfully saved:\n\n" + "\n".join(saved_files)
+            self.root.after(0, messagebox.showinfo, "Save Complete", message)
         
         except Exception as e:
-            messagebox.showerror("Save Error", f"Failed to save files: {str(e)}")
+            self.root.after(0, messagebox.showerror, "Save Error", f"Failed to save files: {str(e)}")
+        finally:
+            self.save_running = False
 
 def main():
     """Main entry point."""
@@ -1559,4 +2309,5 @@ def main():
     root.mainloop()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Lets validation worker processes start from a frozen build
     main()
\ No newline at end of file